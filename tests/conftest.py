@@ -0,0 +1,67 @@
+"""
+Shared pytest fixtures for wslsync tests
+"""
+
+import os
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+
+import wslsync.sync as sync_mod
+from wslsync.config import WSLSyncConfig
+
+# Files created in the shared source tree, relative to its root
+SOURCE_SPEC = (
+    ("file1.txt", b"content1"),
+    ("subdir/file2.txt", b"content2"),
+    ("file3.txt", b"content3"),
+)
+SOURCE_FILES = tuple(rel_path for rel_path, _ in SOURCE_SPEC)
+
+# Stale files in each destination that a sync should remove
+DEST_SPEC = (
+    ("old_file.txt", b"old content"),
+    ("temp.log", b"temp data"),
+)
+
+
+def _populate(root: Path, spec: Tuple[Tuple[str, bytes], ...]) -> None:
+    """Create files under root, making each parent directory only once"""
+    parents = {os.path.dirname(rel_path) for rel_path, _ in spec}
+    for parent in sorted(parents, key=len):
+        os.makedirs(os.path.join(root, parent), exist_ok=True)
+    for rel_path, data in spec:
+        (root / rel_path).write_bytes(data)
+
+
+@pytest.fixture(scope="session")
+def source_tree(tmp_path_factory):
+    """Source directory created once per session; tests must not modify it"""
+    source_dir = tmp_path_factory.mktemp("source")
+    _populate(source_dir, SOURCE_SPEC)
+    return source_dir
+
+
+@pytest.fixture
+def dest_dir(tmp_path):
+    """Per-test destination directory with files that should be cleaned up"""
+    dest = tmp_path / "dest"
+    _populate(dest, DEST_SPEC)
+    return dest
+
+
+@pytest.fixture(scope="session")
+def base_config(source_tree):
+    """Template configuration; derive variants with dataclasses.replace"""
+    return WSLSyncConfig(
+        windows_base=source_tree,
+        wsl2_base=Path("/home/user/dest"),
+        files=SOURCE_FILES,
+    )
+
+
+@pytest.fixture(scope="session")
+def sync_module():
+    """The wslsync.sync module, imported once for the whole session"""
+    return sync_mod
@@ -0,0 +1,24 @@
+"""
+Helpers shared by the wslsync test modules
+"""
+
+import os
+from pathlib import Path
+from typing import Union
+
+# Keep test file I/O in memory when a tmpfs is available
+TMPFS = "/dev/shm" if Path("/dev/shm").is_dir() else None
+
+
+def fast_rmtree(path: Union[str, Path]) -> None:
+    """Remove a directory tree bottom-up, relative to each directory's fd"""
+    for _root, dirs, files, rootfd in os.fwalk(path, topdown=False):
+        for name in files:
+            os.unlink(name, dir_fd=rootfd)
+        for name in dirs:
+            # fwalk lists symlinks to directories in dirs without following them
+            try:
+                os.rmdir(name, dir_fd=rootfd)
+            except NotADirectoryError:
+                os.unlink(name, dir_fd=rootfd)
+    os.rmdir(path)
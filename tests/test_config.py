@@ -5,6 +5,7 @@ TDD tests for config.py module
 
 import tempfile
 import unittest
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 from unittest.mock import mock_open, patch
 
@@ -13,6 +14,8 @@ from wslsync.config import (
     get_default_config_path,
     parse_config,
     validate_config,
+    validate_config_paths_exist,
+    validate_config_structural,
 )
 
 
@@ -30,7 +33,7 @@ class TestWSLSyncConfig(unittest.TestCase):
 
         self.assertEqual(config.windows_base, Path("/mnt/c/source"))
         self.assertEqual(config.wsl2_base, Path("/home/user/dest"))
-        self.assertEqual(config.files, ["file1.txt", "file2.txt"])
+        self.assertEqual(config.files, ("file1.txt", "file2.txt"))
 
     def test_wslsync_config_defaults(self):
         """Test WSLSyncConfig with default values"""
@@ -39,7 +42,14 @@ class TestWSLSyncConfig(unittest.TestCase):
         # Test default values (will fail until implemented)
         self.assertIsNone(config.windows_base)
         self.assertIsNone(config.wsl2_base)
-        self.assertEqual(config.files, [])
+        self.assertEqual(config.files, ())
+
+    def test_wslsync_config_is_immutable(self):
+        """Test that WSLSyncConfig instances cannot be modified"""
+        config = WSLSyncConfig(windows_base=Path("/mnt/c/source"))
+
+        with self.assertRaises(FrozenInstanceError):
+            config.windows_base = Path("/mnt/c/other")
 
 
 class TestParseConfig(unittest.TestCase):
@@ -156,6 +166,53 @@ files = [
         # Clean up
         config_path.unlink()
 
+    def test_parse_config_files_list_on_next_line(self):
+        """Test parsing a files list whose bracket opens on the next line"""
+        config_content = """windows_base = /mnt/c/source
+wsl2_base = /home/user/dest
+files =
+[
+    "docs"
+]"""
+
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".wslsync", delete=False
+        ) as f:
+            f.write(config_content)
+            f.flush()
+
+            config_path = Path(f.name)
+
+            config = parse_config(config_path)
+
+            self.assertEqual(config.files, ("docs",))
+
+        # Clean up
+        config_path.unlink()
+
+    def test_parse_config_reparses_modified_file(self):
+        """Test that cached results are invalidated when the file changes"""
+        with tempfile.NamedTemporaryFile(
+            mode="w", suffix=".wslsync", delete=False
+        ) as f:
+            f.write(self.test_config_content)
+            f.flush()
+
+            config_path = Path(f.name)
+
+            first = parse_config(config_path)
+            second = parse_config(config_path)
+            self.assertEqual(first, second)
+
+            config_path.write_text(
+                self.test_config_content.replace('    "scripts/backup.sh"\n', "")
+            )
+            updated = parse_config(config_path)
+            self.assertNotIn("scripts/backup.sh", updated.files)
+
+        # Clean up
+        config_path.unlink()
+
 
 class TestValidateConfig(unittest.TestCase):
     """Test cases for validate_config function"""
@@ -239,9 +296,63 @@ class TestValidateConfig(unittest.TestCase):
         self.assertIn("duplicate", str(context.exception).lower())
 
 
+class TestValidateConfigPhases(unittest.TestCase):
+    """Test cases for structural and filesystem validation phases"""
+
+    def test_validate_config_structural_no_filesystem_access(self):
+        """Test structural validation accepts paths that don't exist"""
+        config = WSLSyncConfig(
+            windows_base=Path("/nonexistent/source"),
+            wsl2_base=Path("/nonexistent/dest"),
+            files=["file1.txt"],
+        )
+
+        self.assertTrue(validate_config_structural(config))
+
+    def test_validate_config_paths_exist_success(self):
+        """Test filesystem validation with existing directories"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = WSLSyncConfig(
+                windows_base=Path(temp_dir),
+                wsl2_base=Path(temp_dir),
+                files=["file1.txt"],
+            )
+
+            self.assertTrue(validate_config_paths_exist(config))
+
+    def test_validate_config_paths_exist_missing_directory(self):
+        """Test filesystem validation with a missing directory"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = WSLSyncConfig(
+                windows_base=Path(temp_dir),
+                wsl2_base=Path("/nonexistent/dest"),
+                files=["file1.txt"],
+            )
+
+            with self.assertRaises(FileNotFoundError):
+                validate_config_paths_exist(config)
+
+    def test_validate_config_paths_exist_base_is_file(self):
+        """Test filesystem validation when a base path is a regular file"""
+        with tempfile.NamedTemporaryFile() as f:
+            config = WSLSyncConfig(
+                windows_base=Path(f.name),
+                wsl2_base=Path(tempfile.gettempdir()),
+                files=["file1.txt"],
+            )
+
+            with self.assertRaisesRegex(FileNotFoundError, "Source directory"):
+                validate_config_paths_exist(config)
+
+
 class TestGetDefaultConfigPath(unittest.TestCase):
     """Test cases for get_default_config_path function"""
 
+    def setUp(self):
+        """Reset the cached default path so Path.home patches take effect"""
+        get_default_config_path.cache_clear()
+        self.addCleanup(get_default_config_path.cache_clear)
+
     @patch("wslsync.config.Path.home")
     def test_get_default_config_path(self, mock_home):
         """Test getting default config path"""
@@ -270,6 +381,17 @@ class TestGetDefaultConfigPath(unittest.TestCase):
         self.assertIsInstance(default_path, Path)
         self.assertTrue(str(default_path).endswith(".wslsync"))
 
+    @patch("wslsync.config.Path.home")
+    def test_get_default_config_path_is_cached(self, mock_home):
+        """Test that the home directory is only looked up once"""
+        mock_home.return_value = Path("/home/testuser")
+
+        first = get_default_config_path()
+        second = get_default_config_path()
+
+        self.assertEqual(first, second)
+        mock_home.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,9 +5,12 @@ Integration tests for wslsync - testing complete sync workflow
 
 import os
 import shutil
+import tempfile
 import unittest
 from pathlib import Path
 
+from tests.helpers import TMPFS, fast_rmtree
+
 
 class TestWSLSyncIntegration(unittest.TestCase):
     """Integration tests for complete WSL sync workflow"""
@@ -17,12 +20,8 @@ class TestWSLSyncIntegration(unittest.TestCase):
         self.test_dir = Path(__file__).parent
         self.config_file = self.test_dir / "fixtures" / ".wslsync"
         self.windows_source = self.test_dir / "mock_windows_source"
-        self.wsl2_dest = self.test_dir / "mock_wsl2_dest"
-
-        # Reset destination directory
-        if self.wsl2_dest.exists():
-            shutil.rmtree(self.wsl2_dest)
-        self.wsl2_dest.mkdir(parents=True)
+        # Sync into a fresh directory so the test never writes to the tree
+        self.wsl2_dest = Path(tempfile.mkdtemp(dir=TMPFS))
 
         # Create pre-existing files that should be cleaned up
         (self.wsl2_dest / "old_file.txt").write_text("Should be deleted")
@@ -31,6 +30,10 @@ class TestWSLSyncIntegration(unittest.TestCase):
         outdated_dir.mkdir()
         (outdated_dir / "legacy.txt").write_text("Legacy file")
 
+    def tearDown(self):
+        """Remove the destination directory"""
+        fast_rmtree(self.wsl2_dest)
+
     def test_complete_sync_workflow(self):
         """Test complete sync: parse config, copy files, cleanup"""
         # Step 1: Parse config (simulate)
@@ -50,14 +53,16 @@ class TestWSLSyncIntegration(unittest.TestCase):
             self.assertTrue(source_file.exists(), f"Source {file_path} must exist")
 
         # Step 2: Copy files
+        # Create each destination directory once, shortest paths first
+        parents = {os.path.dirname(f) for f in files_to_sync if os.path.dirname(f)}
+        for parent in sorted(parents, key=len):
+            os.makedirs(os.path.join(self.wsl2_dest, parent), exist_ok=True)
+
         copied_files = []
         for file_path in files_to_sync:
             source = self.windows_source / file_path
             dest = self.wsl2_dest / file_path
 
-            # Create directory structure
-            dest.parent.mkdir(parents=True, exist_ok=True)
-
             # Copy file
             shutil.copy2(source, dest)
             copied_files.append(str(dest.relative_to(self.wsl2_dest)))
@@ -65,23 +70,16 @@ class TestWSLSyncIntegration(unittest.TestCase):
         # Step 3: Cleanup files not in sync list
         files_to_keep = set(files_to_sync)
 
-        # Get all files currently in destination
-        all_files = []
-        for item in self.wsl2_dest.rglob("*"):
-            if item.is_file():
-                rel_path = str(item.relative_to(self.wsl2_dest))
-                all_files.append(rel_path)
-
-        # Remove files not in keep list
-        for file_path in all_files:
-            if file_path not in files_to_keep:
-                file_obj = self.wsl2_dest / file_path
-                file_obj.unlink()
-
-        # Remove empty directories
-        for item in list(self.wsl2_dest.rglob("*")):
-            if item.is_dir() and not any(item.iterdir()):
-                item.rmdir()
+        # Remove files not in keep list and then empty directories in a
+        # single bottom-up walk, so children are handled before parents
+        for root, _dirs, files in os.walk(self.wsl2_dest, topdown=False):
+            rel_root = os.path.relpath(root, self.wsl2_dest)
+            for name in files:
+                rel_path = name if rel_root == "." else f"{rel_root}/{name}"
+                if rel_path not in files_to_keep:
+                    os.unlink(os.path.join(root, name))
+            if root != str(self.wsl2_dest) and not os.listdir(root):
+                os.rmdir(root)
 
         # Step 4: Verify final state
         # Check that all expected files exist
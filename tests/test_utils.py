@@ -3,13 +3,15 @@
 TDD tests for utils.py module
 """
 
+import errno
 import logging
-import shutil
+import os
 import tempfile
 import unittest
 from pathlib import Path
-from unittest.mock import MagicMock, mock_open, patch
+from unittest.mock import patch
 
+from tests.helpers import TMPFS, fast_rmtree
 from wslsync.utils import (
     ensure_directory_exists,
     format_file_size,
@@ -22,6 +24,12 @@ from wslsync.utils import (
     setup_logging,
 )
 
+# Paths shared by the pure path tests, parsed once at import
+USER_HOME = Path("/home/user")
+PROJECT = USER_HOME / "project"
+DEEP_FILE = PROJECT / "src" / "deep" / "nested" / "file.txt"
+OTHER_FILE = Path("/home/other/file.txt")
+
 
 class TestSetupLogging(unittest.TestCase):
     """Test cases for setup_logging function"""
@@ -43,7 +51,7 @@ class TestSetupLogging(unittest.TestCase):
 
     def test_setup_logging_with_file(self):
         """Test setup_logging with log file"""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
+        with tempfile.NamedTemporaryFile(dir=TMPFS, delete=False) as f:
             log_file = Path(f.name)
 
         logger = setup_logging(log_level="WARNING", log_file=log_file)
@@ -69,7 +77,7 @@ class TestSafeCopyFile(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = Path(tempfile.mkdtemp(dir=TMPFS))
         self.source_file = self.temp_dir / "source.txt"
         self.dest_file = self.temp_dir / "dest.txt"
 
@@ -78,7 +86,7 @@ class TestSafeCopyFile(unittest.TestCase):
 
     def tearDown(self):
         """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir)
+        fast_rmtree(self.temp_dir)
 
     def test_safe_copy_file_success(self):
         """Test successful file copy"""
@@ -128,6 +136,46 @@ class TestSafeCopyFile(unittest.TestCase):
         with self.assertRaises(PermissionError):
             safe_copy_file(self.source_file, restricted_dest)
 
+    def test_safe_copy_file_relative_to_dir_fd(self):
+        """Test copying to a name relative to an open directory descriptor"""
+        dir_fd = os.open(self.temp_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            result = safe_copy_file(self.source_file, Path("dest.txt"), dir_fd=dir_fd)
+        finally:
+            os.close(dir_fd)
+
+        self.assertTrue(result)
+        self.assertEqual(self.source_file.read_text(), self.dest_file.read_text())
+        self.assertEqual(
+            self.source_file.stat().st_mtime_ns, self.dest_file.stat().st_mtime_ns
+        )
+
+    def test_safe_copy_file_userspace_fallback(self):
+        """Test copying through the buffer loop when kernel copies are unsupported"""
+        data = os.urandom(2 * (1 << 20) + 123)  # spans several buffer fills
+        self.source_file.write_bytes(data)
+        unsupported = OSError(errno.ENOSYS, "not supported")
+
+        with patch.object(os, "copy_file_range", side_effect=unsupported, create=True):
+            with patch.object(os, "sendfile", side_effect=unsupported):
+                result = safe_copy_file(self.source_file, self.dest_file)
+
+        self.assertTrue(result)
+        self.assertEqual(data, self.dest_file.read_bytes())
+
+    def test_safe_copy_file_kernel_copy_returning_zero(self):
+        """Test that a kernel copy reporting 0 bytes doesn't truncate the copy"""
+        data = b"not empty"
+        self.source_file.write_bytes(data)
+
+        with patch.object(os, "copy_file_range", return_value=0, create=True):
+            self.assertTrue(safe_copy_file(self.source_file, self.dest_file))
+            self.assertEqual(data, self.dest_file.read_bytes())
+
+            with patch.object(os, "sendfile", return_value=0):
+                self.assertTrue(safe_copy_file(self.source_file, self.dest_file))
+                self.assertEqual(data, self.dest_file.read_bytes())
+
     def test_safe_copy_file_creates_dest_directory(self):
         """Test that safe_copy_file creates destination directory"""
         nested_dest = self.temp_dir / "nested" / "dir" / "file.txt"
@@ -144,13 +192,13 @@ class TestSafeRemoveFile(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = Path(tempfile.mkdtemp(dir=TMPFS))
         self.test_file = self.temp_dir / "test.txt"
         self.test_file.write_text("test content")
 
     def tearDown(self):
         """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir)
+        fast_rmtree(self.temp_dir)
 
     def test_safe_remove_file_success(self):
         """Test successful file removal"""
@@ -192,14 +240,14 @@ class TestGetFileSize(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = Path(tempfile.mkdtemp(dir=TMPFS))
         self.test_file = self.temp_dir / "test.txt"
         self.test_content = "Hello, World!" * 100  # 1300 bytes
         self.test_file.write_text(self.test_content)
 
     def tearDown(self):
         """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir)
+        fast_rmtree(self.temp_dir)
 
     def test_get_file_size_success(self):
         """Test getting file size successfully"""
@@ -241,8 +289,8 @@ class TestGetRelativePath(unittest.TestCase):
 
     def test_get_relative_path_success(self):
         """Test getting relative path successfully"""
-        base_path = Path("/home/user/project")
-        file_path = Path("/home/user/project/src/main.py")
+        base_path = PROJECT
+        file_path = PROJECT / "src" / "main.py"
 
         # This will fail until get_relative_path is implemented
         relative = get_relative_path(file_path, base_path)
@@ -252,8 +300,8 @@ class TestGetRelativePath(unittest.TestCase):
 
     def test_get_relative_path_same_path(self):
         """Test getting relative path when file and base are the same"""
-        base_path = Path("/home/user/project")
-        file_path = Path("/home/user/project")
+        base_path = PROJECT
+        file_path = PROJECT
 
         relative = get_relative_path(file_path, base_path)
 
@@ -261,8 +309,8 @@ class TestGetRelativePath(unittest.TestCase):
 
     def test_get_relative_path_not_under_base(self):
         """Test getting relative path when file is not under base"""
-        base_path = Path("/home/user/project")
-        file_path = Path("/home/other/file.txt")
+        base_path = PROJECT
+        file_path = OTHER_FILE
 
         # This should raise ValueError
         with self.assertRaises(ValueError):
@@ -270,8 +318,8 @@ class TestGetRelativePath(unittest.TestCase):
 
     def test_get_relative_path_nested_deep(self):
         """Test getting relative path with deep nesting"""
-        base_path = Path("/home/user")
-        file_path = Path("/home/user/project/src/deep/nested/file.txt")
+        base_path = USER_HOME
+        file_path = DEEP_FILE
 
         relative = get_relative_path(file_path, base_path)
 
@@ -283,11 +331,11 @@ class TestEnsureDirectoryExists(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures"""
-        self.temp_dir = Path(tempfile.mkdtemp())
+        self.temp_dir = Path(tempfile.mkdtemp(dir=TMPFS))
 
     def tearDown(self):
         """Clean up test fixtures"""
-        shutil.rmtree(self.temp_dir)
+        fast_rmtree(self.temp_dir)
 
     def test_ensure_directory_exists_create_new(self):
         """Test creating new directory"""
@@ -333,8 +381,8 @@ class TestIsPathSafe(unittest.TestCase):
 
     def test_is_path_safe_valid_path(self):
         """Test path safety with valid path"""
-        base_path = Path("/home/user/project")
-        safe_path = Path("/home/user/project/src/file.txt")
+        base_path = PROJECT
+        safe_path = PROJECT / "src" / "file.txt"
 
         # This will fail until is_path_safe is implemented
         result = is_path_safe(safe_path, base_path)
@@ -343,8 +391,8 @@ class TestIsPathSafe(unittest.TestCase):
 
     def test_is_path_safe_same_path(self):
         """Test path safety with same path"""
-        base_path = Path("/home/user/project")
-        same_path = Path("/home/user/project")
+        base_path = PROJECT
+        same_path = PROJECT
 
         result = is_path_safe(same_path, base_path)
 
@@ -352,8 +400,8 @@ class TestIsPathSafe(unittest.TestCase):
 
     def test_is_path_safe_parent_escape(self):
         """Test path safety with parent directory escape"""
-        base_path = Path("/home/user/project")
-        escape_path = Path("/home/user/project/../../../etc/passwd")
+        base_path = PROJECT
+        escape_path = PROJECT / "../../../etc/passwd"
 
         result = is_path_safe(escape_path, base_path)
 
@@ -361,8 +409,8 @@ class TestIsPathSafe(unittest.TestCase):
 
     def test_is_path_safe_outside_base(self):
         """Test path safety with path outside base"""
-        base_path = Path("/home/user/project")
-        outside_path = Path("/home/other/file.txt")
+        base_path = PROJECT
+        outside_path = OTHER_FILE
 
         result = is_path_safe(outside_path, base_path)
 
@@ -370,13 +418,29 @@ class TestIsPathSafe(unittest.TestCase):
 
     def test_is_path_safe_relative_path(self):
         """Test path safety with relative path"""
-        base_path = Path("/home/user/project")
+        base_path = PROJECT
         relative_path = Path("src/file.txt")
 
         result = is_path_safe(relative_path, base_path)
 
         self.assertTrue(result)
 
+    def test_is_path_safe_relative_base_follows_chdir(self):
+        """Test that a relative base is resolved against the current directory"""
+        first_dir = tempfile.mkdtemp(dir=TMPFS)
+        second_dir = tempfile.mkdtemp(dir=TMPFS)
+        inside_first = Path(first_dir, "dest", "file.txt")
+        original_cwd = os.getcwd()
+        try:
+            os.chdir(first_dir)
+            self.assertTrue(is_path_safe(inside_first, Path("dest")))
+            os.chdir(second_dir)
+            self.assertFalse(is_path_safe(inside_first, Path("dest")))
+        finally:
+            os.chdir(original_cwd)
+            os.rmdir(first_dir)
+            os.rmdir(second_dir)
+
 
 class TestFormatFileSize(unittest.TestCase):
     """Test cases for format_file_size function"""
@@ -3,45 +3,57 @@
 Test suite for wslsync
 """
 
+import filecmp
 import os
 import shutil
 import tempfile
 import unittest
 from pathlib import Path
 
+from tests.helpers import TMPFS, fast_rmtree
+from wslsync.sync import _batch_copy
+
+# Pre-existing destination files that cleanup should remove
+DEST_FIXTURES = (
+    ("old_file.txt", b"This should be deleted"),
+    ("temp_data.log", b"Temporary data"),
+    ("outdated_folder/legacy.txt", b"Legacy file"),
+)
+
 
 class TestWSLSync(unittest.TestCase):
     """Test cases for WSL sync functionality"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up paths shared by every test"""
+        cls.test_dir = Path(__file__).parent
+        cls.config_file = cls.test_dir / "fixtures" / ".wslsync"
+        cls.windows_source = cls.test_dir / "mock_windows_source"
+        cls.wsl2_dest = Path(tempfile.mkdtemp(dir=TMPFS))
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the shared destination directory"""
+        fast_rmtree(cls.wsl2_dest)
+
     def setUp(self):
         """Set up test environment"""
-        self.test_dir = Path(__file__).parent
-        self.config_file = self.test_dir / "fixtures" / ".wslsync"
-        self.windows_source = self.test_dir / "mock_windows_source"
-        self.wsl2_dest = self.test_dir / "mock_wsl2_dest"
-
-        # Reset destination directory for each test
-        if self.wsl2_dest.exists():
-            shutil.rmtree(self.wsl2_dest)
-        self.wsl2_dest.mkdir(parents=True)
+        # Replace the destination left by the previous test with an empty one
+        fast_rmtree(self.wsl2_dest)
+        self.wsl2_dest.mkdir()
 
         # Create some existing files for cleanup testing
-        (self.wsl2_dest / "old_file.txt").write_text("This should be deleted")
-        (self.wsl2_dest / "temp_data.log").write_text("Temporary data")
-        outdated_dir = self.wsl2_dest / "outdated_folder"
-        outdated_dir.mkdir()
-        (outdated_dir / "legacy.txt").write_text("Legacy file")
-
-    def tearDown(self):
-        """Clean up after tests"""
-        pass
+        (self.wsl2_dest / "outdated_folder").mkdir()
+        for rel_path, data in DEST_FIXTURES:
+            (self.wsl2_dest / rel_path).write_bytes(data)
 
     def test_config_parsing(self):
         """Test parsing of .wslsync config file"""
         # This test will verify config file parsing
         # Expected format:
         # windows_base = tests/mock_windows_source
-        # wsl2_base = tests/mock_wsl2_dest
+        # wsl2_base = /tmp/wslsync_dest
         # files = [list of relative paths]
 
         self.assertTrue(self.config_file.exists(), "Config file should exist")
@@ -90,25 +102,26 @@ class TestWSLSync(unittest.TestCase):
             "projects/app/main.py",
         ]
 
-        # Simulate copying files
+        # Create destination directories, then copy all files in one batch
+        pairs = []
         for file_path in files_to_copy:
-            source = self.windows_source / file_path
             dest = self.wsl2_dest / file_path
-
-            # Create destination directory if it doesn't exist
             dest.parent.mkdir(parents=True, exist_ok=True)
+            pairs.append((str(self.windows_source / file_path), str(dest)))
 
-            # Copy file
-            shutil.copy2(source, dest)
+        _batch_copy(pairs)
+
+        for file_path in files_to_copy:
+            source = self.windows_source / file_path
+            dest = self.wsl2_dest / file_path
 
             # Verify file was copied
             self.assertTrue(dest.exists(), f"File {file_path} should be copied")
 
             # Verify content matches
-            source_content = source.read_text()
-            dest_content = dest.read_text()
-            self.assertEqual(
-                source_content, dest_content, f"Content should match for {file_path}"
+            self.assertTrue(
+                filecmp.cmp(source, dest, shallow=False),
+                f"Content should match for {file_path}",
             )
 
     def test_cleanup_functionality(self):
@@ -138,18 +151,19 @@ class TestWSLSync(unittest.TestCase):
             dest.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(source, dest)
 
-        # Simulate cleanup: remove files not in keep_files list
-        for item in self.wsl2_dest.rglob("*"):
-            if item.is_file():
-                # Get relative path from dest base
-                rel_path = item.relative_to(self.wsl2_dest)
-                if str(rel_path) not in keep_files:
-                    item.unlink()
-
-        # Remove empty directories
-        for item in list(self.wsl2_dest.rglob("*")):
-            if item.is_dir() and not any(item.iterdir()):
-                item.rmdir()
+        # Simulate cleanup in one bottom-up pass: remove files not in
+        # keep_files, then any subdirectories that were left empty
+        keep = frozenset(keep_files)
+        for root, dirs, files, rootfd in os.fwalk(self.wsl2_dest, topdown=False):
+            for name in files:
+                rel_path = os.path.relpath(os.path.join(root, name), self.wsl2_dest)
+                if rel_path not in keep:
+                    os.unlink(name, dir_fd=rootfd)
+            for name in dirs:
+                try:
+                    os.rmdir(name, dir_fd=rootfd)
+                except OSError:
+                    pass  # Not empty
 
         # Verify cleanup files are gone
         for file_path in cleanup_files:
@@ -186,7 +200,7 @@ class TestWSLSync(unittest.TestCase):
     def test_empty_destination_directory(self):
         """Test sync to completely empty destination"""
         # Clean destination completely
-        shutil.rmtree(self.wsl2_dest)
+        fast_rmtree(self.wsl2_dest)
         self.wsl2_dest.mkdir()
 
         # Verify empty
@@ -9,20 +9,55 @@ __version__ = "0.1.0"
 __author__ = "WSL Sync Tool"
 __email__ = "noreply@example.com"
 
-from .config import (
-    WSLSyncConfig,
-    get_default_config_path,
-    parse_config,
-    validate_config,
-)
-from .sync import WSLSyncEngine
-from .utils import setup_logging
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .config import (
+        WSLSyncConfig,
+        get_default_config_path,
+        parse_config,
+        validate_config,
+        validate_config_paths_exist,
+        validate_config_structural,
+    )
+    from .sync import WSLSyncEngine
+    from .utils import setup_logging
+
+# Public names and the submodule defining each; the submodule is only imported
+# the first time one of its names is accessed (PEP 562)
+_LAZY_ATTRS = {
+    "WSLSyncConfig": "config",
+    "parse_config": "config",
+    "validate_config": "config",
+    "validate_config_structural": "config",
+    "validate_config_paths_exist": "config",
+    "get_default_config_path": "config",
+    "WSLSyncEngine": "sync",
+    "setup_logging": "utils",
+}
 
 __all__ = [
     "WSLSyncConfig",
     "parse_config",
     "validate_config",
+    "validate_config_structural",
+    "validate_config_paths_exist",
     "get_default_config_path",
     "WSLSyncEngine",
     "setup_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
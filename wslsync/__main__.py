@@ -4,23 +4,24 @@ Command-line interface for WSL sync tool.
 This module provides the main entry point and CLI interface.
 """
 
-import argparse
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from .config import get_default_config_path, parse_config, validate_config
-from .sync import WSLSyncEngine
-from .utils import setup_logging
+if TYPE_CHECKING:
+    import argparse
 
 
-def create_argument_parser() -> argparse.ArgumentParser:
+def create_argument_parser() -> "argparse.ArgumentParser":
     """
     Create and configure command-line argument parser.
 
     Returns:
         Configured ArgumentParser instance
     """
+    # Imported here so main's --version fast path never loads argparse
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="WSL Sync Tool - Synchronize files between Windows and WSL2",
         prog="wslsync",
@@ -65,14 +66,23 @@ def main(args: Optional[list] = None) -> int:
         Exit code (0 for success, non-zero for failure)
     """
     try:
+        argv = sys.argv[1:] if args is None else args
+
+        # Answer a bare --version without building the argument parser
+        if argv == ["--version"]:
+            show_version()
+            return 0
+
         parser = create_argument_parser()
-        parsed_args = parser.parse_args(args)
+        parsed_args = parser.parse_args(argv)
 
         # Handle version command
         if parsed_args.version:
             show_version()
             return 0
 
+        from .config import get_default_config_path
+
         # Determine config path
         if parsed_args.config:
             config_path = Path(parsed_args.config)
@@ -107,6 +117,11 @@ def run_sync(config_path: Path, dry_run: bool = False, verbose: bool = False) ->
     Returns:
         Exit code (0 for success, non-zero for failure)
     """
+    # Imported here so --help and --version don't load the sync engine
+    from .config import parse_config, validate_config
+    from .sync import WSLSyncEngine
+    from .utils import setup_logging
+
     try:
         # Setup logging
         log_level = "DEBUG" if verbose else "INFO"
@@ -125,30 +140,22 @@ def run_sync(config_path: Path, dry_run: bool = False, verbose: bool = False) ->
 
             # Show what would be done
             try:
+                # sync() checks the base directories itself; a dry run must
+                # fail on them the same way
+                engine.validate_paths()
                 source_files = engine.get_source_files()
-                dest_files = engine.get_destination_files()
-
-                logger.info(f"Would copy {len(source_files)} files")
-                for file_path in source_files:
-                    logger.info(f"  Would copy: {file_path}")
-
-                logger.info(f"Would clean up files not in sync list")
-                for file_path in dest_files:
-                    rel_path = (
-                        file_path.relative_to(config.wsl2_base)
-                        if config.wsl2_base
-                        else file_path
-                    )
-                    # Check if file is under any of the configured paths
-                    should_keep = False
-                    for config_path_str in config.files:
-                        if str(rel_path) == config_path_str or str(rel_path).startswith(
-                            config_path_str + "/"
-                        ):
-                            should_keep = True
-                            break
-                    if not should_keep:
-                        logger.info(f"  Would delete: {file_path}")
+                # The same rules cleanup applies decide what would go
+                files_to_delete = engine.files_to_delete()
+
+                # Each listing goes out as one multi-line log record, so a
+                # large tree doesn't pay for a record and a write per file
+                copies = [f"Would copy {len(source_files)} files"]
+                copies.extend(f"  Would copy: {path}" for path in source_files)
+                logger.info("\n".join(copies))
+
+                deletions = ["Would clean up files not in sync list"]
+                deletions.extend(f"  Would delete: {path}" for path in files_to_delete)
+                logger.info("\n".join(deletions))
 
             except Exception as e:
                 logger.error(f"Error during dry run analysis: {e}")
@@ -179,6 +186,8 @@ def validate_config_command(config_path: Path) -> int:
     Returns:
         Exit code (0 if valid, non-zero if invalid)
     """
+    from .config import parse_config, validate_config
+
     try:
         print(f"Validating configuration file: {config_path}")
 
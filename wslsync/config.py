@@ -4,19 +4,103 @@ Configuration parser for WSL sync tool.
 This module handles parsing and validation of .wslsync configuration files.
 """
 
+import os
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
+# Quoted entries inside the files list, compiled once at import time
+_QUOTED_RE = re.compile(r'"([^"]*)"')
 
-@dataclass
+
+@dataclass(frozen=True)
 class WSLSyncConfig:
-    """Configuration data structure for WSL sync operations."""
+    """
+    Configuration data structure for WSL sync operations.
+
+    Instances are immutable and hashable; ``files`` is always stored as a
+    tuple. Use ``dataclasses.replace`` to derive a modified configuration.
+    """
 
     windows_base: Optional[Path] = None
     wsl2_base: Optional[Path] = None
-    files: List[str] = field(default_factory=list)
+    files: Tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of paths (e.g. a list) from callers; tuples,
+        # including the shared empty default, are kept as-is
+        if not isinstance(self.files, tuple):
+            object.__setattr__(self, "files", tuple(self.files))
+
+
+# Parsed configs keyed by path, validated against (st_mtime_ns, st_size).
+# The cache is per process: parsing takes tens of microseconds, less than
+# importing pickle to load a cached copy from disk would.
+_PARSE_CACHE: Dict[Path, Tuple[Tuple[int, int], WSLSyncConfig]] = {}
+_PARSE_CACHE_MAX_ENTRIES = 32
+
+
+def _scan_fields(content: str) -> Dict[str, str]:
+    """
+    Split config text into its fields in a single pass over the lines.
+
+    Comments run from "#" to the end of the line. The first non-empty
+    ``key = value`` line wins for each key. The value of ``files`` is the
+    raw text between its brackets, which may span several lines and may
+    open on the line after ``files =``.
+
+    Args:
+        content: Contents of a .wslsync file
+
+    Returns:
+        Mapping of field name to its raw value
+    """
+    fields: Dict[str, str] = {}
+    files_lines: Optional[List[str]] = None  # set while inside "files = ["
+    files_pending = False  # set after a bare "files =" line
+
+    for raw_line in content.splitlines():
+        line = raw_line.split("#", 1)[0].strip()
+        if not line:
+            continue
+
+        if files_lines is not None:
+            end = line.find("]")
+            if end < 0:
+                files_lines.append(line)
+            else:
+                files_lines.append(line[:end])
+                fields["files"] = "\n".join(files_lines)
+                files_lines = None
+            continue
+
+        if files_pending and line.startswith("["):
+            files_pending = False
+            key, value = "files", line
+        else:
+            files_pending = False
+            key, sep, value = line.partition("=")
+            key, value = key.strip(), value.strip()
+            if not sep or key in fields:
+                continue
+            if not value:
+                # The bracketed list may open on the next line
+                files_pending = key == "files"
+                continue
+
+        if key == "files":
+            if value.startswith("["):
+                end = value.find("]")
+                if end < 0:
+                    files_lines = [value[1:]]
+                else:
+                    fields["files"] = value[1:end]
+        elif key in ("windows_base", "wsl2_base"):
+            fields[key] = value
+
+    return fields
 
 
 def parse_config(config_path: Path) -> WSLSyncConfig:
@@ -33,53 +117,88 @@ def parse_config(config_path: Path) -> WSLSyncConfig:
         FileNotFoundError: If config file doesn't exist
         ValueError: If config file format is invalid
     """
-    if not config_path.exists():
-        raise FileNotFoundError(f"Config file not found: {config_path}")
+    try:
+        st = config_path.stat()
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Config file not found: {config_path}") from e
+
+    # Reuse the previous parse while the file is unchanged on disk
+    cache_key = (st.st_mtime_ns, st.st_size)
+    cached = _PARSE_CACHE.get(config_path)
+    if cached is not None and cached[0] == cache_key:
+        return cached[1]
 
     content = config_path.read_text().strip()
     if not content:
         raise ValueError("Config file is empty")
 
-    config = WSLSyncConfig()
+    fields = _scan_fields(content)
+    for name in ("windows_base", "wsl2_base", "files"):
+        if name not in fields:
+            raise ValueError(f"Missing required field: {name}")
 
-    # Remove comments and empty lines
-    lines = []
-    for line in content.split("\n"):
-        line = line.split("#")[0].strip()  # Remove comments
-        if line:
-            lines.append(line)
+    windows_base = Path(fields["windows_base"])
+    wsl2_base = Path(fields["wsl2_base"])
 
-    content_clean = "\n".join(lines)
+    # Parse comma-separated quoted strings
+    file_entries = _QUOTED_RE.findall(fields["files"])
 
-    # Parse windows_base
-    windows_match = re.search(r"windows_base\s*=\s*(.+)", content_clean)
-    if not windows_match:
-        raise ValueError("Missing required field: windows_base")
-    config.windows_base = Path(windows_match.group(1).strip())
+    config = WSLSyncConfig(
+        windows_base=windows_base, wsl2_base=wsl2_base, files=tuple(file_entries)
+    )
 
-    # Parse wsl2_base
-    wsl2_match = re.search(r"wsl2_base\s*=\s*(.+)", content_clean)
-    if not wsl2_match:
-        raise ValueError("Missing required field: wsl2_base")
-    config.wsl2_base = Path(wsl2_match.group(1).strip())
+    if len(_PARSE_CACHE) >= _PARSE_CACHE_MAX_ENTRIES:
+        del _PARSE_CACHE[next(iter(_PARSE_CACHE))]
+    _PARSE_CACHE[config_path] = (cache_key, config)
 
-    # Parse files list
-    files_match = re.search(r"files\s*=\s*\[(.*?)\]", content_clean, re.DOTALL)
-    if not files_match:
-        raise ValueError("Missing required field: files")
+    return config
 
-    files_str = files_match.group(1).strip()
-    if files_str:
-        # Parse comma-separated quoted strings
-        file_entries = re.findall(r'"([^"]*)"', files_str)
-        config.files = file_entries
 
-    return config
+_REQUIRED_FIELDS = ("windows_base", "wsl2_base")
+
+
+def _is_empty_path(path: Optional[Path]) -> bool:
+    """Return True if a configured base path is blank or the current directory."""
+    text = str(path)
+    return text.strip() == "" or text == "."
+
+
+# Validation rules as (failure predicate, error message), evaluated in order
+_VALIDATION_RULES: Tuple[Tuple[Callable[[WSLSyncConfig], bool], str], ...] = (
+    *(
+        (lambda c, name=name: getattr(c, name) is None, f"{name} is required")
+        for name in _REQUIRED_FIELDS
+    ),
+    (lambda c: not c.files, "files list cannot be empty"),
+    *(
+        (
+            lambda c, name=name: _is_empty_path(getattr(c, name)),
+            f"Invalid path format: {name} path cannot be empty",
+        )
+        for name in _REQUIRED_FIELDS
+    ),
+    (
+        lambda c: len(c.files) != len(set(c.files)),
+        "Duplicate files found in configuration",
+    ),
+)
+
+
+@lru_cache(maxsize=128)
+def _validate_cached(config: WSLSyncConfig) -> bool:
+    """Run the validation rules; only successful results are cached."""
+    for failed, message in _VALIDATION_RULES:
+        if failed(config):
+            raise ValueError(message)
+    return True
 
 
-def validate_config(config: WSLSyncConfig) -> bool:
+def validate_config_structural(config: WSLSyncConfig) -> bool:
     """
-    Validate configuration settings.
+    Validate configuration settings without touching the filesystem.
+
+    Results are memoized per configuration, which is safe because
+    WSLSyncConfig is immutable.
 
     Args:
         config: Configuration object to validate
@@ -90,33 +209,92 @@ def validate_config(config: WSLSyncConfig) -> bool:
     Raises:
         ValueError: If configuration is invalid with details
     """
-    if config.windows_base is None:
-        raise ValueError("windows_base is required")
+    return _validate_cached(config)
 
-    if config.wsl2_base is None:
-        raise ValueError("wsl2_base is required")
 
-    if not config.files:
-        raise ValueError("files list cannot be empty")
+def _probe_directory(path: Path) -> None:
+    """
+    Check that a directory can be listed by reading at most one entry.
 
-    # Check for empty paths
-    if str(config.windows_base).strip() == "" or str(config.windows_base) == ".":
-        raise ValueError("Invalid path format: windows_base path cannot be empty")
+    Opening the directory proves it exists and is readable, so no separate
+    existence stat is needed, and at most one entry is read however large
+    the directory is.
 
-    if str(config.wsl2_base).strip() == "" or str(config.wsl2_base) == ".":
-        raise ValueError("Invalid path format: wsl2_base path cannot be empty")
+    Args:
+        path: Directory to check
+
+    Raises:
+        PermissionError: If the directory cannot be read
+        OSError: If the directory cannot be opened
+    """
+    with os.scandir(path) as entries:
+        next(entries, None)
 
-    # Check for duplicate files
-    if len(config.files) != len(set(config.files)):
-        raise ValueError("Duplicate files found in configuration")
+
+def validate_config_paths_exist(config: WSLSyncConfig) -> bool:
+    """
+    Check that the configured base directories exist and are readable.
+
+    This performs filesystem I/O and is meant to run right before syncing,
+    after validate_config_structural has accepted the configuration.
+
+    Args:
+        config: Configuration object to check
+
+    Returns:
+        True if both base directories exist and can be listed
+
+    Raises:
+        ValueError: If a base path is not configured
+        FileNotFoundError: If a base directory doesn't exist
+        PermissionError: If a base directory cannot be read
+    """
+    if config.windows_base is None or config.wsl2_base is None:
+        raise ValueError("windows_base and wsl2_base are required")
+
+    for base, role in (
+        (config.windows_base, "Source"),
+        (config.wsl2_base, "Destination"),
+    ):
+        try:
+            _probe_directory(base)
+        except (FileNotFoundError, NotADirectoryError) as e:
+            raise FileNotFoundError(f"{role} directory not found: {base}") from e
+        except PermissionError as e:
+            raise PermissionError(
+                f"Cannot access {role.lower()} directory: {base}"
+            ) from e
 
     return True
 
 
+def validate_config(config: WSLSyncConfig) -> bool:
+    """
+    Validate configuration settings.
+
+    Equivalent to validate_config_structural; use validate_config_paths_exist
+    to additionally check the base directories on disk.
+
+    Args:
+        config: Configuration object to validate
+
+    Returns:
+        True if configuration is valid
+
+    Raises:
+        ValueError: If configuration is invalid with details
+    """
+    return validate_config_structural(config)
+
+
+@lru_cache(maxsize=1)
 def get_default_config_path() -> Path:
     """
     Get the default path for .wslsync config file.
 
+    The home directory does not change within a process, so the result is
+    computed once. Call ``get_default_config_path.cache_clear()`` to reset.
+
     Returns:
         Path to default config file location (home directory)
     """
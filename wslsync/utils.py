@@ -5,10 +5,57 @@ This module provides helper functions for file operations, logging,
 and other common tasks.
 """
 
+import errno
 import logging
+import os
 import shutil
+import stat
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import AbstractSet, Iterator, List, Optional, Union
+
+# Largest transfer requested from copy_file_range/sendfile per call
+_MAX_KERNEL_COPY = 1 << 30
+
+# Buffer size for the userspace fallback in _copy_fd
+_COPY_BUFFER_SIZE = 1 << 20
+
+# get_sync_summary result when nothing was copied or deleted
+_EMPTY_SUMMARY = "Sync completed: 0 files copied, 0 files deleted"
+
+# Units used by format_file_size, each 1024 times the previous
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Errors meaning an in-kernel copy isn't supported for this pair of files
+_KERNEL_COPY_UNSUPPORTED = (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP)
+
+
+def _walk(
+    root: Union[str, Path], prune: AbstractSet[str] = frozenset()
+) -> Iterator["os.DirEntry[str]"]:
+    """
+    Recursively yield every entry below root using os.scandir.
+
+    DirEntry caches the file type reported by the directory listing, so
+    is_file()/is_dir() usually need no extra stat, and no Path objects are
+    built for entries the caller skips. Symlinks to directories are yielded
+    but not descended into.
+
+    Args:
+        root: Directory to walk
+        prune: Directory paths, as joined below root, to yield but not
+            descend into
+
+    Yields:
+        DirEntry for each file and directory below root
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                yield entry
+                if entry.is_dir(follow_symlinks=False) and entry.path not in prune:
+                    stack.append(entry.path)
 
 
 def setup_logging(
@@ -64,16 +111,77 @@ def setup_logging(
     return logger
 
 
+def _copy_fd(src_fd: int, dst_fd: int) -> None:
+    """
+    Copy the remaining contents of src_fd to dst_fd.
+
+    Tries os.copy_file_range (which can reflink or copy server-side), then
+    os.sendfile, then a userspace loop over a reused 1 MiB buffer. All three
+    advance the file offsets, so a fallback resumes where the last one
+    stopped.
+
+    Args:
+        src_fd: File descriptor open for reading
+        dst_fd: File descriptor open for writing
+
+    Raises:
+        OSError: If reading or writing fails
+    """
+    # Some filesystems (FUSE, procfs-like files, older kernels across
+    # filesystems) make the kernel copies return 0 without copying anything.
+    # A 0 on the first call is therefore not trusted as EOF; the next method
+    # is tried, and the final read loop decides whether the source is empty.
+    copy_file_range = getattr(os, "copy_file_range", None)
+    if copy_file_range is not None:
+        try:
+            if copy_file_range(src_fd, dst_fd, _MAX_KERNEL_COPY):
+                while copy_file_range(src_fd, dst_fd, _MAX_KERNEL_COPY):
+                    pass
+                return
+        except OSError as e:
+            if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+
+    try:
+        if os.sendfile(dst_fd, src_fd, None, _MAX_KERNEL_COPY):
+            while os.sendfile(dst_fd, src_fd, None, _MAX_KERNEL_COPY):
+                pass
+            return
+    except OSError as e:
+        if e.errno not in _KERNEL_COPY_UNSUPPORTED + (errno.ENOTSOCK,):
+            raise
+
+    buf = memoryview(bytearray(_COPY_BUFFER_SIZE))
+    while True:
+        n = os.readv(src_fd, [buf])
+        if not n:
+            return
+        written = 0
+        while written < n:
+            written += os.write(dst_fd, buf[written:n])
+
+
 def safe_copy_file(
-    source: Path, destination: Path, preserve_timestamps: bool = True
+    source: Path,
+    destination: Path,
+    preserve_timestamps: bool = True,
+    dir_fd: Optional[int] = None,
 ) -> bool:
     """
     Safely copy a file from source to destination with error handling.
 
+    The file mode is always copied; access and modification times are
+    copied when preserve_timestamps is set. Both are applied through the
+    open destination descriptor rather than by path.
+
     Args:
         source: Source file path
         destination: Destination file path
         preserve_timestamps: Whether to preserve file timestamps
+        dir_fd: Optional open directory descriptor. When given, destination
+            is resolved relative to it (so copying many files into one
+            directory skips the full path walk) and no parent directories
+            are created
 
     Returns:
         True if copy was successful, False otherwise
@@ -83,17 +191,45 @@ def safe_copy_file(
         PermissionError: If insufficient permissions
         OSError: If copy operation fails
     """
-    if not source.exists():
-        raise FileNotFoundError(f"Source file not found: {source}")
+    try:
+        src_stat = os.stat(source)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Source file not found: {source}") from None
 
     # Create destination directory if needed
-    destination.parent.mkdir(parents=True, exist_ok=True)
+    if dir_fd is None:
+        destination.parent.mkdir(parents=True, exist_ok=True)
 
     try:
-        if preserve_timestamps:
-            shutil.copy2(source, destination)
+        # Opening the destination truncates it, so refuse to copy onto itself
+        try:
+            dst_stat = os.stat(destination, dir_fd=dir_fd)
+        except FileNotFoundError:
+            pass
         else:
-            shutil.copy(source, destination)
+            if (dst_stat.st_dev, dst_stat.st_ino) == (src_stat.st_dev, src_stat.st_ino):
+                raise shutil.SameFileError(
+                    f"{source} and {destination} are the same file"
+                )
+
+        src_fd = os.open(source, os.O_RDONLY)
+        try:
+            dst_fd = os.open(
+                destination,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                0o644,
+                dir_fd=dir_fd,
+            )
+            try:
+                _copy_fd(src_fd, dst_fd)
+                os.fchmod(dst_fd, stat.S_IMODE(src_stat.st_mode))
+                if preserve_timestamps:
+                    os.utime(dst_fd, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
         return True
     except PermissionError as e:
         raise PermissionError(
@@ -146,17 +282,19 @@ def get_file_size(file_path: Path) -> int:
         FileNotFoundError: If file doesn't exist
         OSError: If stat operation fails
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    if file_path.is_dir():
-        raise OSError(f"Cannot get size of directory: {file_path}")
-
+    # One stat answers existence, type and size
     try:
-        return file_path.stat().st_size
+        st = os.stat(file_path)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {file_path}") from e
     except OSError as e:
         raise OSError(f"Failed to get size of {file_path}") from e
 
+    if stat.S_ISDIR(st.st_mode):
+        raise OSError(f"Cannot get size of directory: {file_path}")
+
+    return st.st_size
+
 
 def get_relative_path(file_path: Path, base_path: Path) -> Path:
     """
@@ -189,11 +327,12 @@ def ensure_directory_exists(directory: Path) -> None:
         PermissionError: If insufficient permissions to create directory
         OSError: If directory creation fails
     """
-    if directory.exists() and not directory.is_dir():
-        raise OSError(f"Path exists but is not a directory: {directory}")
-
     try:
-        directory.mkdir(parents=True, exist_ok=True)
+        # Existing directories cost a single failed mkdir; makedirs only
+        # raises FileExistsError when the existing path isn't a directory
+        os.makedirs(directory, exist_ok=True)
+    except FileExistsError as e:
+        raise OSError(f"Path exists but is not a directory: {directory}") from e
     except PermissionError as e:
         raise PermissionError(
             f"Permission denied creating directory: {directory}"
@@ -202,10 +341,29 @@ def ensure_directory_exists(directory: Path) -> None:
         raise OSError(f"Failed to create directory: {directory}") from e
 
 
+@lru_cache(maxsize=64)
+def _resolve_base(base_path: str) -> str:
+    """
+    Resolve a base directory, memoized since many paths share one base.
+
+    Args:
+        base_path: Absolute base directory path; a relative one would be
+            cached against whatever the working directory was at first use
+
+    Returns:
+        Canonical absolute path with symlinks resolved
+    """
+    return os.path.realpath(base_path)
+
+
 def is_path_safe(path: Path, base_path: Path) -> bool:
     """
     Check if a path is safe (doesn't escape base directory).
 
+    The base directory's resolved location is cached, so replacing a base
+    directory with a symlink mid-process isn't picked up; the checked path
+    itself is always resolved afresh.
+
     Args:
         path: Path to check
         base_path: Base directory that should contain the path
@@ -213,22 +371,12 @@ def is_path_safe(path: Path, base_path: Path) -> bool:
     Returns:
         True if path is safe (within base_path), False otherwise
     """
+    # Key the cache on the absolute base so relative bases follow chdir
+    resolved_base = _resolve_base(os.path.abspath(base_path))
+    # Relative paths are taken relative to the base; absolute ones replace it
+    resolved_path = os.path.realpath(os.path.join(resolved_base, path))
     try:
-        # Handle relative paths by treating them as safe if they are under base
-        if not path.is_absolute():
-            # For relative paths, join with base and check if it stays under base
-            full_path = (base_path / path).resolve()
-            resolved_base = base_path.resolve()
-            full_path.relative_to(resolved_base)
-            return True
-        else:
-            # Resolve both paths to absolute paths
-            resolved_path = path.resolve()
-            resolved_base = base_path.resolve()
-
-            # Check if the resolved path is under the base path
-            resolved_path.relative_to(resolved_base)
-            return True
+        return os.path.commonpath([resolved_path, resolved_base]) == resolved_base
     except ValueError:
         return False
 
@@ -243,24 +391,16 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted size string (e.g., "1.5 MB", "256 KB")
     """
-    if size_bytes < 0:
-        return "0 B"
-
-    if size_bytes == 0:
+    if size_bytes <= 0:
         return "0 B"
 
-    units = ["B", "KB", "MB", "GB", "TB"]
-    size = float(size_bytes)
-    unit_index = 0
-
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
+    # Each unit is 2**10 of the previous one, so the bit length picks the
+    # unit directly; sizes past the last unit stay in TB
+    unit_index = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
 
     if unit_index == 0:
-        return f"{int(size)} {units[unit_index]}"
-    else:
-        return f"{size:.1f} {units[unit_index]}"
+        return f"{size_bytes} B"
+    return f"{size_bytes / (1 << (10 * unit_index)):.1f} {_SIZE_UNITS[unit_index]}"
 
 
 def get_sync_summary(copied_files: List[Path], deleted_files: List[Path]) -> str:
@@ -274,21 +414,20 @@ def get_sync_summary(copied_files: List[Path], deleted_files: List[Path]) -> str
     Returns:
         Formatted summary string
     """
-    copied_count = len(copied_files)
-    deleted_count = len(deleted_files)
+    if not copied_files and not deleted_files:
+        return _EMPTY_SUMMARY
 
-    summary = (
-        f"Sync completed: {copied_count} files copied, {deleted_count} files deleted"
-    )
+    lines = [
+        f"Sync completed: {len(copied_files)} files copied, "
+        f"{len(deleted_files)} files deleted"
+    ]
 
-    if copied_count > 0:
-        summary += f"\nCopied files:"
-        for file_path in copied_files:
-            summary += f"\n  - {file_path.name}"
+    if copied_files:
+        lines.append("Copied files:")
+        lines.extend(f"  - {file_path.name}" for file_path in copied_files)
 
-    if deleted_count > 0:
-        summary += f"\nDeleted files:"
-        for file_path in deleted_files:
-            summary += f"\n  - {file_path.name}"
+    if deleted_files:
+        lines.append("Deleted files:")
+        lines.extend(f"  - {file_path.name}" for file_path in deleted_files)
 
-    return summary
+    return "\n".join(lines)